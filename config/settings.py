@@ -25,6 +25,22 @@ PREVIEW_FRAME_HEIGHT = 300
 THUMBNAIL_SIZE = (140, 140)
 CONTAINER_SIZE = {"width": 160, "height": 180}
 
+# Edge refinement configuration
+EDGE_TILE_SIZE = 64         # Height of the strips edge windows are grouped into
+EDGE_CELL_SIZE = 8          # Grid cell size used to locate the subject boundary
+EDGE_ALPHA_THRESHOLD = 128  # Alpha value separating foreground from background
+EDGE_WINDOW_AREA_LIMIT = 1.0  # Filter the whole image once padded windows exceed its area
+
+# Upscaling configuration
+UPSCALE_MODEL_PATH = os.environ.get(
+    "BG_REMOVER_UPSCALE_MODEL",
+    str(Path.home() / ".bg_remover" / "models" / "realesrgan_x4.onnx")
+)
+UPSCALE_MODEL_SCALE = 4     # Native scale factor of the super-resolution model
+UPSCALE_TILE_SIZE = 128     # Tile size fed to the model (keeps memory bounded)
+UPSCALE_TILE_OVERLAP = 16   # Context pixels around each tile to hide seams
+UPSCALE_WORKERS = min(os.cpu_count() or 1, 4)  # Each worker holds a full tile's activations
+
 # Slider configurations
 SLIDER_CONFIGS = {
     "smooth_edges": {
@@ -43,7 +59,7 @@ SLIDER_CONFIGS = {
         "label": "Upscale Factor",
         "from_": 1,
         "to": 4,
-        "tooltip": "Uses AI to enhance resolution.\n1 = No upscaling (recommended)\n2 = Double resolution\n4 = Quadruple resolution"
+        "tooltip": "Uses a local AI super-resolution model to enhance resolution.\nFalls back to a standard resize if the model is missing.\n1 = No upscaling (recommended)\n2 = Double resolution\n4 = Quadruple resolution"
     }
 }
 
@@ -0,0 +1,115 @@
+import numpy as np
+from scipy import ndimage
+from PIL import Image, ImageFilter
+
+from config.settings import (
+    EDGE_TILE_SIZE,
+    EDGE_CELL_SIZE,
+    EDGE_ALPHA_THRESHOLD,
+    EDGE_WINDOW_AREA_LIMIT
+)
+
+
+def refine_edges(img, radius):
+    """Smooth the alpha channel only inside a narrow band around the subject edge"""
+    if radius <= 0:
+        return img
+
+    rgba = np.array(img if img.mode == "RGBA" else img.convert("RGBA"))
+    foreground = rgba[..., 3] >= EDGE_ALPHA_THRESHOLD
+    height, width = foreground.shape
+
+    # Trimap: pixels within band_width of the boundary are "unknown" and get
+    # refined, everything else keeps its original value
+    band_width = 2 * radius
+
+    # Pillow's Gaussian is three box passes, each reaching at most radius + 1
+    # pixels, so windows padded this far filter their centre exactly as a
+    # whole-image pass would
+    padding = max(3 * (radius + 1), band_width)
+
+    windows = [
+        (top, bottom, left, right,
+         max(top - padding, 0), min(bottom + padding, height),
+         max(left - padding, 0), min(right + padding, width))
+        for top, bottom, left, right in _band_windows(foreground, band_width)
+    ]
+
+    # On edge-dense masks the padded windows mostly overlap; one pass over the
+    # whole image is then cheaper and gives identical band pixels
+    filtered_area = sum((b - t) * (r - l) for _, _, _, _, t, b, l, r in windows)
+    if filtered_area > EDGE_WINDOW_AREA_LIMIT * height * width:
+        windows = [(0, height, 0, width, 0, height, 0, width)]
+
+    # Windows overlap through their padding, so results are written back only
+    # once every window has been filtered from the original pixels
+    updates = []
+    for top, bottom, left, right, win_top, win_bottom, win_left, win_right in windows:
+        inner = (slice(top - win_top, bottom - win_top), slice(left - win_left, right - win_left))
+
+        band = _boundary_band(foreground[win_top:win_bottom, win_left:win_right], band_width)[inner]
+        if not band.any():
+            continue
+
+        # Blur premultiplied colour so newly opaque pixels take the foreground
+        # colour, not the background
+        window = Image.fromarray(rgba[win_top:win_bottom, win_left:win_right], "RGBA")
+        smooth = window.convert("RGBa").filter(ImageFilter.GaussianBlur(radius)).convert("RGBA")
+        updates.append((top, bottom, left, right, band, np.asarray(smooth)[inner]))
+
+    for top, bottom, left, right, band, smooth in updates:
+        np.copyto(rgba[top:bottom, left:right], smooth, where=band[..., np.newaxis])
+
+    return Image.fromarray(rgba, "RGBA")
+
+
+def _boundary_band(foreground, band_width):
+    """Return the pixels within band_width of the foreground/background boundary"""
+    # Running min/max filters cost the same for any band width
+    size = 2 * band_width + 1
+    mask = foreground.view(np.uint8)
+    grown = ndimage.maximum_filter(mask, size=size, mode="nearest")
+    shrunk = ndimage.minimum_filter(mask, size=size, mode="nearest")
+    return grown != shrunk
+
+
+def _band_windows(foreground, band_width):
+    """Yield (top, bottom, left, right) windows that together cover the boundary band"""
+    height, width = foreground.shape
+    rows = -(-height // EDGE_CELL_SIZE)
+    cols = -(-width // EDGE_CELL_SIZE)
+
+    # Classify coarse cells: a cell holding both foreground and background
+    # contains the boundary, as does a full cell touching an empty one
+    padded = np.pad(
+        foreground,
+        ((0, rows * EDGE_CELL_SIZE - height), (0, cols * EDGE_CELL_SIZE - width)),
+        mode="edge"
+    )
+    cells = padded.reshape(rows, EDGE_CELL_SIZE, cols, EDGE_CELL_SIZE)
+    full = cells.all(axis=(1, 3))
+    empty = ~cells.any(axis=(1, 3))
+    neighbours = np.ones((3, 3), bool)
+    boundary = (~full & ~empty) | (full & ndimage.binary_dilation(empty, neighbours))
+
+    # Only cells within band_width of a boundary cell can hold band pixels
+    reach = 2 * (-(-band_width // EDGE_CELL_SIZE)) + 1
+    band_cells = ndimage.maximum_filter(boundary.view(np.uint8), size=reach).view(bool)
+
+    # Group band cells into horizontal runs per tile row, trimmed to the rows
+    # and columns the band actually occupies
+    cells_per_tile = EDGE_TILE_SIZE // EDGE_CELL_SIZE
+    for row in range(0, rows, cells_per_tile):
+        strip = band_cells[row:row + cells_per_tile]
+        occupied = strip.any(axis=0)
+        edges = np.diff(np.concatenate(([0], occupied.view(np.int8), [0])))
+        starts, = np.nonzero(edges == 1)
+        ends, = np.nonzero(edges == -1)
+        for start, end in zip(starts, ends):
+            run_rows, = np.nonzero(strip[:, start:end].any(axis=1))
+            yield (
+                (row + run_rows[0]) * EDGE_CELL_SIZE,
+                min((row + run_rows[-1] + 1) * EDGE_CELL_SIZE, height),
+                start * EDGE_CELL_SIZE,
+                min(end * EDGE_CELL_SIZE, width)
+            )
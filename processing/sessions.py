@@ -0,0 +1,22 @@
+from functools import lru_cache
+
+import onnxruntime as ort
+from rembg import new_session
+
+
+@lru_cache(maxsize=None)
+def get_rembg_session(model_name="u2net"):
+    """Return a cached rembg session so the model is loaded only once"""
+    return new_session(model_name)
+
+
+@lru_cache(maxsize=None)
+def get_onnx_session(model_path, intra_op_threads=1):
+    """Return a cached CPU ONNX Runtime session for the given model file"""
+    options = ort.SessionOptions()
+    options.intra_op_num_threads = intra_op_threads
+    return ort.InferenceSession(
+        model_path,
+        sess_options=options,
+        providers=["CPUExecutionProvider"]
+    )
@@ -0,0 +1,126 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from scipy import ndimage
+from PIL import Image
+
+from config.settings import (
+    UPSCALE_MODEL_PATH,
+    UPSCALE_MODEL_SCALE,
+    UPSCALE_TILE_SIZE,
+    UPSCALE_TILE_OVERLAP,
+    UPSCALE_WORKERS
+)
+from processing.sessions import get_onnx_session
+
+# Lanczos reads 3 source pixels either side, so alpha this close to a tile
+# still shows up inside it after resizing
+LANCZOS_SUPPORT = 3
+
+
+def upscale(img, factor):
+    """Upscale an RGBA image with the super-resolution model, tile by tile"""
+    if factor <= 1:
+        return img
+
+    target_size = (img.width * factor, img.height * factor)
+    if not os.path.exists(UPSCALE_MODEL_PATH):
+        print(f"⚠️ Upscale model not found at {UPSCALE_MODEL_PATH}, using standard resize")
+        return img.resize(target_size, Image.LANCZOS)
+
+    try:
+        return _upscale_with_model(img, factor)
+    except Exception as e:
+        print(f"⚠️ AI upscaling failed ({e}), using standard resize")
+        return img.resize(target_size, Image.LANCZOS)
+
+
+def _upscale_with_model(img, factor):
+    """Run the model over every non-transparent tile and assemble the result"""
+    session = get_onnx_session(UPSCALE_MODEL_PATH)
+
+    rgba = np.array(img.convert("RGBA"))
+    alpha = rgba[..., 3]
+    height, width = alpha.shape
+
+    # Tiles with no alpha in or near them stay black/transparent and never
+    # hit the model; the margin keeps resized alpha from reaching into them
+    tiles = [
+        (top, left)
+        for top in range(0, height, UPSCALE_TILE_SIZE)
+        for left in range(0, width, UPSCALE_TILE_SIZE)
+        if alpha[
+            max(top - LANCZOS_SUPPORT, 0):top + UPSCALE_TILE_SIZE + LANCZOS_SUPPORT,
+            max(left - LANCZOS_SUPPORT, 0):left + UPSCALE_TILE_SIZE + LANCZOS_SUPPORT
+        ].any()
+    ]
+
+    # Tiles are scaled to the requested factor as they finish, so the buffer
+    # never grows beyond the final image size
+    output = np.zeros((height * factor, width * factor, 4), dtype=np.uint8)
+    if tiles:
+        # The first tile runs alone so a model/scale mismatch is reported
+        # clearly before the pool starts
+        _upscale_tile(session, rgba, output, factor, *tiles[0], check_scale=True)
+        with ThreadPoolExecutor(max_workers=UPSCALE_WORKERS) as executor:
+            # Each tile writes a disjoint region of the output, so no locking needed
+            list(executor.map(
+                lambda corner: _upscale_tile(session, rgba, output, factor, *corner),
+                tiles[1:]
+            ))
+
+    # Alpha is cheap to resize conventionally and keeps the cut-out shape exact
+    output[..., 3] = np.asarray(Image.fromarray(alpha).resize((width * factor, height * factor), Image.LANCZOS))
+
+    return Image.fromarray(output, "RGBA")
+
+
+def _upscale_tile(session, rgba, output, factor, top, left, check_scale=False):
+    """Run the model on one tile plus its overlap and write the centre into output"""
+    height, width = rgba.shape[:2]
+    bottom = min(top + UPSCALE_TILE_SIZE, height)
+    right = min(left + UPSCALE_TILE_SIZE, width)
+
+    win_top = max(top - UPSCALE_TILE_OVERLAP, 0)
+    win_left = max(left - UPSCALE_TILE_OVERLAP, 0)
+    win_bottom = min(bottom + UPSCALE_TILE_OVERLAP, height)
+    win_right = min(right + UPSCALE_TILE_OVERLAP, width)
+    win_height, win_width = win_bottom - win_top, win_right - win_left
+
+    model_input = session.get_inputs()[0]
+    dtype = np.float16 if model_input.type == "tensor(float16)" else np.float32
+    # Transparent pixels are black after background removal; give them the
+    # nearest foreground colour so the resized alpha edge doesn't pick it up
+    window = rgba[win_top:win_bottom, win_left:win_right]
+    transparent = window[..., 3] == 0
+    if transparent.any() and not transparent.all():
+        nearest = ndimage.distance_transform_edt(
+            transparent, return_distances=False, return_indices=True
+        )
+        window = window[tuple(nearest)]
+
+    patch = window[..., :3].astype(dtype) / 255
+    patch = patch.transpose(2, 0, 1)[np.newaxis]
+
+    result = session.run(None, {model_input.name: patch})[0][0]
+    expected = (win_height * UPSCALE_MODEL_SCALE, win_width * UPSCALE_MODEL_SCALE)
+    if check_scale and result.shape[1:] != expected:
+        raise ValueError(
+            f"model returned {result.shape[2]}x{result.shape[1]} for a {win_width}x{win_height} "
+            f"input, expected {UPSCALE_MODEL_SCALE}x (check UPSCALE_MODEL_SCALE)"
+        )
+
+    window = Image.fromarray(np.clip(
+        result.transpose(1, 2, 0).astype(np.float32) * 255 + 0.5, 0, 255
+    ).astype(np.uint8))
+
+    # Resize the whole window rather than the bare tile so the filter has
+    # real neighbours at the seams
+    if factor != UPSCALE_MODEL_SCALE:
+        window = window.resize((win_width * factor, win_height * factor), Image.LANCZOS)
+
+    output[top * factor:bottom * factor, left * factor:right * factor, :3] = np.asarray(window)[
+        (top - win_top) * factor:(bottom - win_top) * factor,
+        (left - win_left) * factor:(right - win_left) * factor
+    ]
@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+from PIL import Image
+
+from processing import upscaler
+
+
+class NearestSession:
+    """Stand-in for an ONNX super-resolution session that repeats pixels"""
+
+    class Input:
+        name = "input"
+        type = "tensor(float)"
+
+    def __init__(self, scale=4):
+        self.scale = scale
+
+    def get_inputs(self):
+        return [self.Input()]
+
+    def run(self, outputs, feed):
+        patch = feed["input"]
+        return [patch.repeat(self.scale, axis=2).repeat(self.scale, axis=3)]
+
+
+@pytest.fixture
+def stub_model(tmp_path, monkeypatch):
+    model_path = tmp_path / "model.onnx"
+    model_path.touch()
+    monkeypatch.setattr(upscaler, "UPSCALE_MODEL_PATH", str(model_path))
+
+    def use(session):
+        monkeypatch.setattr(upscaler, "get_onnx_session", lambda path: session)
+    return use
+
+
+def white_square():
+    img = Image.new("RGBA", (300, 300), (0, 0, 0, 0))
+    img.paste((255, 255, 255, 255), (100, 100, 200, 200))
+    # Ends exactly on a tile border, so the next tile holds no alpha itself
+    img.paste((255, 255, 255, 255), (200, 260, 256, 280))
+    return img
+
+
+@pytest.mark.parametrize("factor", [2, 3, 4])
+def test_edges_keep_foreground_colour(stub_model, factor):
+    stub_model(NearestSession())
+    result = np.array(upscaler.upscale(white_square(), factor))
+
+    visible = result[..., 3] > 0
+    assert visible.any()
+    assert (result[visible, :3] >= 250).all()
+
+
+def test_alpha_matches_plain_resize(stub_model):
+    stub_model(NearestSession())
+    img = white_square()
+    result = np.array(upscaler.upscale(img, 4))
+    expected = np.array(img.resize((1200, 1200), Image.LANCZOS))
+
+    assert (result[..., 3] == expected[..., 3]).all()
+
+
+def test_scale_mismatch_falls_back_to_resize(stub_model):
+    stub_model(NearestSession(scale=2))
+    img = white_square()
+    result = upscaler.upscale(img, 4)
+
+    assert result.size == (1200, 1200)
+    assert np.array_equal(np.array(result), np.array(img.resize((1200, 1200), Image.LANCZOS)))
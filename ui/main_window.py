@@ -5,7 +5,7 @@ from CTkMessagebox import CTkMessagebox
 import tkinter.messagebox as messagebox
 import webbrowser
 from tkinter import filedialog
-from PIL import Image, ImageFilter
+from PIL import Image
 from rembg import remove
 from pathlib import Path
 
@@ -19,6 +19,9 @@ from config.settings import (
 )
 from ui.image_preview import ImagePreview
 from ui.control_panel import ControlPanel
+from processing.edge_refine import refine_edges
+from processing.sessions import get_rembg_session
+from processing.upscaler import upscale
 
 # Set theme
 ctk.set_appearance_mode(APPEARANCE_MODE)
@@ -222,7 +225,7 @@ class BGRemoverApp(ctk.CTk):
             # Read and remove background
             with open(file_path, 'rb') as f:
                 input_data = f.read()
-                output_data = remove(input_data)
+                output_data = remove(input_data, session=get_rembg_session())
             
             # Load processed image
             img = Image.open(io.BytesIO(output_data)).convert("RGBA")
@@ -260,14 +263,10 @@ class BGRemoverApp(ctk.CTk):
         
         # Smooth edges
         if settings["smooth_edges"] > 0:
-            img = img.filter(ImageFilter.GaussianBlur(radius=settings["smooth_edges"]))
+            img = refine_edges(img, settings["smooth_edges"])
         
         # Upscale
         if settings["upscale_factor"] > 1:
-            new_size = (
-                img.width * settings["upscale_factor"], 
-                img.height * settings["upscale_factor"]
-            )
-            img = img.resize(new_size, Image.LANCZOS)
+            img = upscale(img, settings["upscale_factor"])
         
         return img
\ No newline at end of file